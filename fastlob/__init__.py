@@ -1,5 +1,6 @@
 from .lob import Orderbook
 from .order import OrderParams
 from .result import ExecutionResult
-from .enums import OrderSide, OrderType, OrderStatus, ResultType
+from .enums import OrderSide, OrderType, OrderStatus, ResultType, EventType
+from .events import Event, QueueWriter, LogHandler
 from .utils import todecimal
\ No newline at end of file
@@ -1 +1 @@
-from .consts import DECIMAL_PRECISION, MIN_VALUE, MAX_VALUE, ORDERS_ID_SIZE, DEFAULT_LIMITS_VIEW
\ No newline at end of file
+from .consts import DECIMAL_PRECISION, SCALE, MIN_VALUE, MAX_VALUE, ORDERS_ID_SIZE, DEFAULT_LIMITS_VIEW
\ No newline at end of file
@@ -11,6 +11,9 @@ def _get_precision() -> int:
 
 DECIMAL_PRECISION: int = _get_precision()
 
+SCALE: int = 10 ** DECIMAL_PRECISION
+'''Number of integer ticks (prices) or lots (quantities) in one unit, used by the fixed-point core.'''
+
 MIN_VALUE = UNIT = Decimal('0.' + ('0' * (DECIMAL_PRECISION - 1)) + '1')
 
 MAX_VALUE = Decimal(int(10e10))
@@ -1,11 +1,10 @@
 '''The engine module is **only** responsible for executing market orders.'''
 
-from decimal import Decimal
-
 from fastlob.side import Side
 from fastlob.order import Order
 from fastlob.enums import OrderSide
 from fastlob.result import ResultBuilder
+from fastlob.utils import fromfixed
 
 def execute(order: Order, side: Side) -> ResultBuilder:
     '''Execute a market order at a given side.'''
@@ -24,23 +23,24 @@ def execute(order: Order, side: Side) -> ResultBuilder:
 
 def _fill_whole_limits(side: Side, order: Order, result: ResultBuilder) -> bool:
     '''While the order to execute is larger than entire limits, fill them.'''
-    while order.quantity() > 0 and not side.empty():
+    while order._quantity > 0 and not side.empty():
         lim = side.best()
+        price, volume = lim._price, lim._volume
 
-        if _oop(order, lim.price()): # if out of price break
-            result.add_message(_oop_msg(lim.price(), order.quantity()))
+        if _oop(order, price): # if out of price break
+            result.add_message(_oop_msg(price, order._quantity))
             return True
 
-        if order.quantity() < lim.volume(): return False # if can not match whole limits anymore, break
+        if order._quantity < volume: return False # if can not match whole limits anymore, break
 
         # update result object
-        result._orders_matched += lim.valid_orders()
-        result._execprices[lim.price()] = lim.volume()
+        result._orders_matched += lim._valid_orders
+        result._execprices[price] = volume
 
-        order.fill(lim.volume()) # partially fill order with limit volume
-        side._volume -= lim.volume() # substract limit volume from side volume before filling all orders in limit
-        lim.fill_all() # set all orders to filled
-        side._limits.pop(lim.price()) # remove limit from side
+        order.fill(volume) # partially fill order with limit volume
+        side._volume -= volume # substract limit volume from side volume before filling all orders in limit
+        result._filled.extend(lim.fill_all()) # set all orders to filled
+        side._limits.pop(price) # remove limit from side
 
     return False
 
@@ -50,21 +50,24 @@ def _fill_whole_orders(side: Side, order: Order, result: ResultBuilder) -> bool:
 
     lim = side.best()
 
-    if _oop(order, lim.price()):
-        result.add_message(_oop_msg(lim.price(), order.quantity()))
+    if _oop(order, lim._price):
+        result.add_message(_oop_msg(lim._price, order._quantity))
         return True
 
-    while order.quantity() > 0:
+    while order._quantity > 0:
         next_order = lim.next_order()
+        quantity = next_order._quantity
 
-        if order.quantity() < next_order.quantity(): return False
+        if order._quantity < quantity: return False
 
         result._orders_matched += 1
-        result._execprices[next_order.price()] += next_order.quantity()
+        result._execprices[next_order._price] += quantity
 
-        order.fill(next_order.quantity())
-        side._volume -= next_order.quantity()
+        order.fill(quantity)
+        side._volume -= quantity
         lim.pop_next_order()
+        next_order.fill(quantity)
+        result._filled.append(next_order)
 
     return False
 
@@ -76,17 +79,19 @@ def _fill_last_order(side: Side, order: Order, result: ResultBuilder):
     lim_order = lim.next_order()
 
     if order.valid():
-        result._execprices[lim_order.price()] += order.quantity()
+        quantity = order._quantity
+        result._execprices[lim_order._price] += quantity
 
-        lim.fill_next(order.quantity())
-        side._volume -= order.quantity()
+        lim.fill_next(quantity)
+        side._volume -= quantity
 
-        order.fill(order.quantity())
+        order.fill(quantity)
 
-def _oop(order: Order, lim_price: Decimal) -> bool:
+def _oop(order: Order, lim_price: int) -> bool:
     '''True if order is out of price.'''
     match order.side():
-        case OrderSide.BID: return order.price() < lim_price
-        case OrderSide.ASK: return order.price() > lim_price
+        case OrderSide.BID: return order._price < lim_price
+        case OrderSide.ASK: return order._price > lim_price
 
-_oop_msg = lambda p, q: f'<matching engine>: order out of price at ({p}), quantity left: ({q})'
\ No newline at end of file
+_oop_msg = lambda p, q: \
+    f'<matching engine>: order out of price at ({fromfixed(p)}), quantity left: ({fromfixed(q)})'
@@ -1 +1 @@
-from .enums import OrderSide, OrderType, OrderStatus, ResultType
+from .enums import OrderSide, OrderType, OrderStatus, ResultType, EventType
@@ -21,7 +21,7 @@ class OrderType(Enum):
     or canceled.
     '''
     GTD = (3,)
-    '''A Good-Til-Day (GTD) order is a type of order that is active until its specified date (UTC seconds timestamp), 
+    '''A Good-Til-Day (GTD) order is a type of order that is active until its specified date (UTC seconds timestamp, millisecond resolution), 
     unless it has already been fulfilled or cancelled.
     '''
 
@@ -56,3 +56,16 @@ class ResultType(Enum):
     '''If the operation was an order cancellation.'''
     ERROR  = 3
     '''If the query could not be processed.'''
+
+class EventType(Enum):
+    '''The type of an order event, sent to the handlers attached to the book.'''
+    ACCEPTED = 0
+    '''The order was accepted by the book and (what is left of it) placed in a limit.'''
+    FILLED   = 1
+    '''The order was executed by the matching engine, entirely or partially.'''
+    CANCELED = 2
+    '''The order was canceled.'''
+    EXPIRED  = 3
+    '''The order (GTD) expired.'''
+    REJECTED = 4
+    '''The order could not be processed.'''
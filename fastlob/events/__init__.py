@@ -0,0 +1 @@
+from .events import Event, Handler, EventSink, QueueWriter, LogHandler
@@ -0,0 +1,130 @@
+'''Structured order events, only built and dispatched when at least one handler is attached to the book.'''
+
+import time, logging, queue, threading
+from typing import Callable, NamedTuple, Optional
+
+from fastlob.enums import OrderSide, EventType
+from fastlob.utils import fromfixed
+
+LEVELS: dict[EventType, int] = {
+    EventType.ACCEPTED: logging.INFO,
+    EventType.FILLED:   logging.INFO,
+    EventType.CANCELED: logging.INFO,
+    EventType.EXPIRED:  logging.INFO,
+    EventType.REJECTED: logging.WARNING,
+}
+'''Level of each event type, handlers only receive the events whose level is at least their own.'''
+
+class Event(NamedTuple):
+    '''An order event, `price` (ticks) and `quantity` (lots) are stored in fixed-point to keep them cheap to build.'''
+
+    kind: EventType
+    orderid: Optional[int]
+    side: Optional[OrderSide]
+    price: Optional[int]
+    quantity: Optional[int]
+    message: Optional[str]
+    timestamp: float
+
+    def level(self) -> int: return LEVELS[self.kind]
+
+    def __str__(self) -> str:
+        side = self.side.name if self.side is not None else None
+        price = fromfixed(self.price) if self.price is not None else None
+        quantity = fromfixed(self.quantity) if self.quantity is not None else None
+        string = f'{self.kind.name} order={self.orderid} side={side} price={price} quantity={quantity}'
+        return string if self.message is None else f'{string} ({self.message})'
+
+Handler = Callable[[Event], None]
+
+class _Subscription:
+    '''A handler attached to a sink, with its level and sampling rate.'''
+
+    __slots__ = ('handler', 'level', 'sample', 'seen')
+
+    def __init__(self, handler: Handler, level: int, sample: int):
+        self.handler = handler
+        self.level   = level
+        self.sample  = sample
+        self.seen    = 0
+
+class EventSink:
+    '''Dispatches events to the attached handlers, the book only holds a sink while a handler is attached.'''
+
+    _subscriptions: list[_Subscription]
+    _level: int
+
+    def __init__(self):
+        self._subscriptions = list()
+        self._level = logging.CRITICAL + 1
+
+    def attach(self, handler: Handler, level: int = logging.INFO, sample: int = 1) -> None:
+        '''Attach a handler.
+
+        Args:
+            handler (Handler): Called with each event.
+            level (int): Minimum event level (`logging` levels) delivered to the handler.
+            sample (int): Only deliver one event out of `sample` to the handler.
+        '''
+        if sample < 1: raise ValueError(f'sample ({sample}) must be at least 1')
+        self._subscriptions.append(_Subscription(handler, level, sample))
+        self._level = min(sub.level for sub in self._subscriptions)
+
+    def detach(self, handler: Handler) -> None:
+        '''Detach a handler (all its subscriptions).'''
+        self._subscriptions = [sub for sub in self._subscriptions if sub.handler != handler]
+        self._level = min((sub.level for sub in self._subscriptions), default=logging.CRITICAL + 1)
+
+    def empty(self) -> bool:
+        '''True if no handler is attached.'''
+        return not self._subscriptions
+
+    def enabled(self, kind: EventType) -> bool:
+        '''True if at least one handler would receive an event of this type.'''
+        return LEVELS[kind] >= self._level
+
+    def emit(self, kind: EventType, orderid: Optional[int] = None, side: Optional[OrderSide] = None,
+             price: Optional[int] = None, quantity: Optional[int] = None, message: Optional[str] = None) -> None:
+        '''Build the event and dispatch it to the handlers, nothing is built if its level is gated.'''
+        level = LEVELS[kind]
+        if level < self._level: return
+
+        event = Event(kind, orderid, side, price, quantity, message, time.time())
+
+        for sub in self._subscriptions:
+            if level < sub.level: continue
+            sub.seen += 1
+            if sub.seen % sub.sample: continue
+            sub.handler(event)
+
+class QueueWriter:
+    '''Handler wrapper moving the (potentially slow) handler call to a background thread.'''
+
+    _handler: Handler
+    _queue: queue.SimpleQueue
+    _thread: threading.Thread
+
+    def __init__(self, handler: Handler):
+        self._handler = handler
+        self._queue   = queue.SimpleQueue()
+        self._thread  = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __call__(self, event: Event) -> None: self._queue.put(event)
+
+    def close(self) -> None:
+        '''Write the pending events and stop the background thread.'''
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while (event := self._queue.get()) is not None: self._handler(event)
+
+class LogHandler:
+    '''Handler writing events to a `logging.Logger`, at their level.'''
+
+    _logger: logging.Logger
+
+    def __init__(self, logger: logging.Logger): self._logger = logger
+
+    def __call__(self, event: Event) -> None: self._logger.log(event.level(), str(event))
@@ -0,0 +1 @@
+from .expiry import ExpiryQueue
@@ -0,0 +1,31 @@
+import heapq
+from typing import Optional
+
+from fastlob.order import Order
+
+class ExpiryQueue:
+    '''GTD orders ordered by expiry (min-heap, millisecond resolution). Orders filled or canceled before their expiry 
+    are not removed from the queue, they are skipped when they become due.'''
+
+    _heap: list[tuple[float, int, Order]]
+
+    def __init__(self): self._heap = list()
+
+    def push(self, order: Order) -> bool:
+        '''Schedule the expiry of an order, returns True if it is now the next one to expire.'''
+        heapq.heappush(self._heap, (order._expiry * 1000, order._id, order))
+        return self._heap[0][1] == order._id
+
+    def next_due(self) -> Optional[float]:
+        '''Timestamp (ms) of the next expiry, or None if there is no order to expire.'''
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: int) -> list[Order]:
+        '''Remove and return all orders whose expiry (ms) is less or equal to `now`.'''
+        heap, due = self._heap, list()
+        while heap and heap[0][0] <= now: due.append(heapq.heappop(heap)[2])
+        return due
+
+    def __len__(self) -> int: return len(self._heap)
+
+    def __repr__(self) -> str: return f'ExpiryQueue(size={len(self)}, next_due={self.next_due()})'
@@ -1,99 +1,130 @@
-from decimal import Decimal
-from collections import deque
+from typing import Optional, Iterator
 
 from fastlob.order import Order
 from fastlob.enums import OrderStatus
-from fastlob.utils import zero
+from fastlob.utils import fromfixed
 
 class Limit:
-    '''A limit is a collection of limit orders sitting at a certain price.'''
+    '''A limit is a collection of limit orders sitting at a certain price. Orders are kept in a FIFO queue, an 
+    intrusive doubly-linked list (through `Order._prev` and `Order._next`) so that any of them can be removed in 
+    O(1) when canceled.'''
 
-    _price: Decimal
-    _volume: Decimal
+    _price: int
+    _volume: int
     _valid_orders: int
-    _orderqueue: deque[Order]
+    _head: Optional[Order]
+    _tail: Optional[Order]
 
-    def __init__(self, price: Decimal):
+    def __init__(self, price: int):
         '''
         Args:
-            price (num): The price at which the limit will sit.
+            price (int): The price (in ticks) at which the limit will sit.
         '''
         self._price        = price
-        self._volume       = zero()
+        self._volume       = 0
         self._valid_orders = 0
-        self._orderqueue   = deque()
+        self._head         = None
+        self._tail         = None
 
-    def price(self) -> Decimal:
-        '''Getter for limit price.'''
+    def price(self) -> int:
+        '''Getter for limit price (in ticks).'''
         return self._price
 
-    def volume(self) -> Decimal:
-        '''Getter for limit volume (sum of orders quantity).'''
+    def volume(self) -> int:
+        '''Getter for limit volume (sum of orders quantity, in lots).'''
         return self._volume
 
-    def notional(self) -> Decimal:
-        '''Notional = limit price * limit volume.'''
-        return self.price() * self.volume()
+    def notional(self) -> int:
+        '''Notional = limit price * limit volume (in ticks * lots).'''
+        return self._price * self._volume
 
     def valid_orders(self) -> int:
         '''Getter for limit size (number of orders).'''
         return self._valid_orders
 
     def empty(self) -> bool:
-        '''Check if limit contains zero **valid** orders, not if the limit queue is empty.'''
-        return self.valid_orders() == 0
+        '''Check if limit contains zero orders.'''
+        return self._valid_orders == 0
 
     def deepempty(self): 
-        '''Check if limit contains zero orders.'''
-        return len(self._orderqueue) == 0
+        '''Check if limit queue is empty, canceled orders being removed right away this is the same as `empty`.'''
+        return self._head is None
+
+    def orders(self) -> Iterator[Order]:
+        '''Iterate over the orders of the limit, in queue order.'''
+        order = self._head
+        while order is not None:
+            yield order
+            order = order._next
 
     def next_order(self) -> Order:
         '''Returns the next order to be matched by an incoming market order.'''
-        self._prune_canceled()
-        return self._orderqueue[0]
+        return self._head
 
     def enqueue(self, order: Order):
         '''Add (enqueue) an order to the limit order queue.'''
-        self._orderqueue.append(order)
+        tail = self._tail
+        order._prev = tail
+        if tail is None: self._head = order
+        else: tail._next = order
+        self._tail = order
+
         order.set_status(OrderStatus.PENDING)
-        self._volume += order.quantity()
+        self._volume += order._quantity
         self._valid_orders += 1
 
-    def fill_next(self, quantity: Decimal):
+    def fill_next(self, quantity: int):
         '''**Partially** fill the next order in the queue. Filling it entirely would lead to problems, to only use in 
         last stage of order execution (`engine._partial_fill_order`).
         '''
-        order = self.next_order()
-        order.fill(quantity)
+        self._head.fill(quantity)
         self._volume -= quantity
 
-    def fill_all(self):
-        '''Fill all orders in limit.'''
-        while self.valid_orders() > 0:
-            order = self.next_order()
-            order.fill(order.quantity())
-            self.pop_next_order()
+    def fill_all(self) -> list[Order]:
+        '''Fill all orders in limit, returns them.'''
+        filled = list()
+        order = self._head
+
+        while order is not None:
+            order.fill(order._quantity)
+            filled.append(order)
+            order._prev, order, order._next = None, order._next, None
+
+        self._head = self._tail = None
+        self._volume = 0
+        self._valid_orders = 0
+        return filled
 
     def pop_next_order(self) -> None:
         '''Pop from the queue the next order to be executed. Does not return it, only removes it.'''
-        self._prune_canceled()
-        order = self._orderqueue.popleft()
+        order = self._head
+        self._unlink(order)
         self._valid_orders -= 1
-        self._volume -= order.quantity()
+        self._volume -= order._quantity
 
     def cancel_order(self, order: Order):
-        '''Cancel an order.'''
-        self._volume -= order.quantity()
+        '''Cancel an order, removing it from the queue.'''
+        self._unlink(order)
+        self._volume -= order._quantity
         self._valid_orders -= 1
         order.set_status(OrderStatus.CANCELED)
 
-    def _prune_canceled(self):
-        '''Pop the next order while it is a canceled one.'''
-        while not self.deepempty() and self._orderqueue[0].status() == OrderStatus.CANCELED: 
-            self._orderqueue.popleft()
+    def _unlink(self, order: Order):
+        '''Remove an order from the queue in O(1).'''
+        prev, next = order._prev, order._next
+
+        if prev is None: self._head = next
+        else: prev._next = next
+
+        if next is None: self._tail = prev
+        else: next._prev = prev
+
+        order._prev = order._next = None
 
     def view(self) -> str:
-        return f'{self.price()} | {self.valid_orders():03d} | {self.volume():0>8f} | {self.notional()}'
+        price, volume = fromfixed(self.price()), fromfixed(self.volume())
+        return f'{price} | {self.valid_orders():03d} | {volume:0>8f} | {price * volume}'
 
     def __repr__(self) -> str:
-        return f'Limit(price={self.price()}, n_orders={self.valid_orders()}, notional={self.notional()})'
+        price, volume = fromfixed(self.price()), fromfixed(self.volume())
+        return f'Limit(price={price}, n_orders={self.valid_orders()}, notional={price * volume})'
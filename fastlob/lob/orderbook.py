@@ -1,6 +1,5 @@
-import io, time, logging, threading
+import io, logging, threading
 from decimal import Decimal
-from sortedcollections import SortedDict
 from typing import Optional, Iterable
 from termcolor import colored
 
@@ -8,9 +7,12 @@ from fastlob import engine
 from fastlob.side import AskSide, BidSide
 from fastlob.limit import Limit
 from fastlob.order import OrderParams, Order, AskOrder, BidOrder
-from fastlob.enums import OrderSide, OrderStatus, OrderType
+from fastlob.enums import OrderSide, OrderStatus, OrderType, ResultType, EventType
 from fastlob.result import ResultBuilder, ExecutionResult
-from fastlob.utils import zero, time_asint
+from fastlob.events import EventSink, Handler
+from fastlob.registry import OrderRegistry, RetentionPolicy, OrderArchive
+from fastlob.expiry import ExpiryQueue
+from fastlob.utils import fromfixed, fromstrid, time_asint, time_asms
 from fastlob.consts import DEFAULT_LIMITS_VIEW
 
 class Orderbook:
@@ -20,24 +22,36 @@ class Orderbook:
     _NAME: str
     _ask_side: AskSide
     _bid_side: BidSide
-    _orders: dict[str, Order]
-    _expirymap: SortedDict
+    _orders: OrderRegistry
+    _expiries: ExpiryQueue
+    _expiry_cond: threading.Condition
+    # ^ protects the expiry queue, notified when the next expiry changes or when the book is stopped
     _start_time: int
     _alive: bool
     _logger: logging.Logger
+    _sink: Optional[EventSink]
 
-    def __init__(self, name: Optional[str] = 'LOB-1'):
+    def __init__(self, name: Optional[str] = 'LOB-1', retention: Optional[RetentionPolicy] = None, 
+                 archive: Optional[str | OrderArchive] = None):
         '''
         Args:
             name (Optional[str]): Name of the LOB. Defaults to "LOB-1".
+            retention (Optional[RetentionPolicy]): When to evict filled, canceled and expired orders from the book 
+                registry. Defaults to None, every order is kept forever.
+            archive (Optional[str | OrderArchive]): Path of the file evicted orders are archived to, so that their 
+                status can still be queried. Defaults to None, evicted orders are forgotten.
         '''
+        if isinstance(archive, str): archive = OrderArchive(archive)
+
         self._NAME       = name
         self._ask_side   = AskSide()
         self._bid_side   = BidSide()
-        self._orders     = dict()
-        self._expirymap  = SortedDict()
+        self._orders     = OrderRegistry(retention, archive)
+        self._expiries   = ExpiryQueue()
+        self._expiry_cond = threading.Condition()
         self._start_time = None
         self._alive      = False
+        self._sink       = None
 
         self._logger = logging.getLogger(f'orderbook[{name}]')
         self._logger.info('initialized, ready to be started (using ob.start())')
@@ -45,24 +59,40 @@ class Orderbook:
     def start(self):
         '''Properly start the limit-order-book.'''
 
-        def clean_expired_orders():
-            while self._alive: 
-                self._cancel_expired_orders()
-                time.sleep(0.9)
-
         self._alive = True
         self._start_time = time_asint()
         self._logger.info('starting background GTD orders manager')
-        threading.Thread(target=clean_expired_orders).start()
+        threading.Thread(target=self._expiry_loop).start()
         self._logger.info('ob started properly')
 
     def stop(self): 
         '''Stop the limit-order-book.'''
 
-        self._alive = False
+        with self._expiry_cond:
+            self._alive = False
+            self._expiry_cond.notify_all()
+
         self._start_time = None
         self._logger.info('ob stopped properly')
 
+    def attach(self, handler: Handler, level: int = logging.INFO, sample: int = 1) -> None:
+        '''Attach an event handler to the book, order events are only built while at least one is attached.
+
+        Args:
+            handler (Handler): Called with each `fastlob.events.Event`, can be wrapped in a `QueueWriter`.
+            level (int): Minimum event level (`logging` levels) delivered to the handler.
+            sample (int): Only deliver one event out of `sample` to the handler.
+        '''
+        sink = self._sink if self._sink is not None else EventSink()
+        sink.attach(handler, level, sample)
+        self._sink = sink
+
+    def detach(self, handler: Handler) -> None:
+        '''Detach an event handler from the book.'''
+        if self._sink is None: return
+        self._sink.detach(handler)
+        if self._sink.empty(): self._sink = None
+
     def reset(self) -> None: 
         '''Reset the limit-order-book.'''
 
@@ -71,7 +101,7 @@ class Orderbook:
             self._logger.error(errmsg)
             return
 
-        self.__init__(self._NAME)
+        self.__init__(self._NAME, self._orders.policy(), self._orders.archive())
 
     def __call__(self, order_params: OrderParams | Iterable[OrderParams]) -> ExecutionResult | list[ExecutionResult]:
         '''Process one or many orders: equivalent to calling `process_one` or `process_many`.'''
@@ -102,7 +132,8 @@ class Orderbook:
             result.add_message(errmsg); self._logger.error(errmsg)
             return result.build()
 
-        self._logger.info('processing order params')
+        if self._expiries and self._expiries.next_due() <= time_asms(): self._expire_due()
+        # ^ expire due orders before matching, so that an expired order is never filled
 
         match order_params.side:
             case OrderSide.ASK: 
@@ -114,19 +145,24 @@ class Orderbook:
                 result = self._process_bid_order(order)
 
         if result._success: 
-            self._logger.info(f'order {order.id()} was processed successfully')
             self._save_order(order)
 
-        else: self._logger.warning(f'order was not successfully processed')
+            if self._orders._policy is not None:
+                if result._filled: self._orders.retire_many(result._filled)
+                self._orders.retire(order)
 
         if order.status() == OrderStatus.PARTIAL:
-            msg = f'order {order.id()} partially filled by engine, {order.quantity()} placed at {order.price()}'
-            self._logger.info(msg)
+            msg = f'order {order.id()} partially filled by engine, {fromfixed(order.quantity())} placed at ' + \
+                f'{fromfixed(order.price())}'
             result.add_message(msg)
 
+        if self._sink is not None: self._emit_processed(order, result)
+
         return result.build()
 
-    def cancel(self, order_id: str) -> ResultBuilder:
+    def cancel(self, order_id: int | str) -> ExecutionResult:
+        '''Cancel an order sitting in the book, `order_id` can also be given in its string form.'''
+
         if not self._alive: 
             errmsg = f'{self._NAME} is not running (start() must be called before it can be used)'
             self._logger.error(errmsg)
@@ -134,42 +170,38 @@ class Orderbook:
             result.add_message(errmsg)
             return result.build()
 
-        self._logger.info(f'attempting to cancel order with id {order_id}')
+        if isinstance(order_id, str): order_id = fromstrid(order_id)
 
         result = ResultBuilder.new_cancel(order_id)
 
-        try: order = self._orders[order_id]
-        except KeyError: 
+        if (order := self._orders.get(order_id)) is None:
             result.set_success(False)
             errmsg = f'order {order_id} not in lob'
             result.add_message(errmsg)
-            self._logger.error(errmsg)
+            if self._sink is not None: self._sink.emit(EventType.REJECTED, order_id, message=errmsg)
             return result.build()
 
         if not order.valid(): 
             result.set_success(False)
             errmsg = f'order {order_id} can not be canceled (status={order.status()})'
             result.add_message(errmsg)
-            self._logger.warning(errmsg)
+            if self._sink is not None: 
+                self._sink.emit(EventType.REJECTED, order_id, order.side(), order.price(), order.quantity(), errmsg)
             return result.build()
 
-        self._logger.info(f'order {order_id} can be canceled')
-
         match order.side():
             case OrderSide.BID: 
-                with self._bid_side.lock(): 
-                    self._logger.info(f'cancelling bid order {order_id}')
-                    self._bid_side.cancel_order(order)
+                with self._bid_side.lock(): self._bid_side.cancel_order(order)
 
             case OrderSide.ASK: 
-                with self._ask_side.lock(): 
-                    self._logger.info(f'cancelling ask order {order_id}')
-                    self._ask_side.cancel_order(order)
+                with self._ask_side.lock(): self._ask_side.cancel_order(order)
+
+        self._orders.retire(order)
 
-        msg = f'order {order.id()} canceled properly'
         result.set_success(True)
-        result.add_message(msg)
-        self._logger.info(msg)
+        result.add_message(f'order {order_id} canceled properly')
+        if self._sink is not None: 
+            self._sink.emit(EventType.CANCELED, order_id, order.side(), order.price(), order.quantity())
         return result.build()
 
     def running_since(self) -> int: 
@@ -181,7 +213,7 @@ class Orderbook:
     def best_ask(self) -> Optional[Decimal]:
         '''Get the best ask price in the book.'''
 
-        try: return self._ask_side.best().price()
+        try: return fromfixed(self._ask_side.best().price())
         except: 
             self._logger.error('calling ob.best_ask() but book does not contain ask limits')
             return None
@@ -189,7 +221,7 @@ class Orderbook:
     def best_bid(self) -> Optional[Decimal]:
         '''Get the best bid price in the book.'''
 
-        try: return self._bid_side.best().price()
+        try: return fromfixed(self._bid_side.best().price())
         except: 
             self._logger.error('calling ob.best_bid() but book does not contain bid limits')
             return None
@@ -227,23 +259,18 @@ class Orderbook:
             self._logger.error('calling ob.spread() but book does not contain limits on both sides')
             return None
 
-    def get_status(self, order_id: str) -> Optional[tuple[OrderStatus, Decimal]]:
+    def get_status(self, order_id: int | str) -> Optional[tuple[OrderStatus, Decimal]]:
         '''Get the status and the quantity left for a given order or None if order was not accepted by the lob.'''
 
-        try: 
-            order = self._orders[order_id]
-            self._logger.info(f'order {order_id} found in book')
-            return order.status(), order.quantity()
-        except KeyError: 
-            self._logger.warning(f'order {order_id} not found in book')
-            return None
+        if isinstance(order_id, str): order_id = fromstrid(order_id)
+
+        if (status := self._orders.status(order_id)) is None: return None
+
+        status, quantity = status
+        return status, fromfixed(quantity)
     
     def _process_bid_order(self, order: BidOrder) -> ResultBuilder:
-        self._logger.info(f'processing bid order {order.id()}')
-
         if self._is_market_bid(order):
-            self._logger.info(f'bid order {order.id()} is market')
-
             if (error := self._check_bid_market_order(order)) is not None: 
                 order.set_status(OrderStatus.ERROR)
                 result = ResultBuilder.new_market(order.id())
@@ -254,44 +281,32 @@ class Orderbook:
             with self._ask_side.lock():
                 result = engine.execute(order, self._ask_side)
 
-            if not result._success:
-                self._logger.error(f'bid market order {order.id()} could not be executed by engine')
-                return result
+            if not result._success: return result
 
             if order.status() == OrderStatus.PARTIAL: 
-                with self._bid_side.lock(): 
-                    self._bid_side.place(order)
-                    msg = f'order {order.id()} partially executed, {order.quantity()} was placed as a bid limit order'
-                    self._logger.info(msg)
-                    result.add_message(msg)
+                with self._bid_side.lock(): self._bid_side.place(order)
+                msg = f'order {order.id()} partially executed, {fromfixed(order.quantity())} was placed as a ' + \
+                    'bid limit order'
+                result.add_message(msg)
 
-            self._logger.info(f'executed bid market order {order.id()}')
             return result
 
         else:
-            self._logger.info(f'bid order {order.id()} is limit')
-
             result = ResultBuilder.new_limit(order.id())
 
             if (error := self._check_limit_order(order)) is not None: 
                 order.set_status(OrderStatus.ERROR)
                 result.set_success(False)
                 result.add_message(error)
-                self._logger.error(error)
                 return result
 
             with self._bid_side.lock(): self._bid_side.place(order)
 
             result.set_success(True)
-            self._logger.info(f'order {order.id()} successfully placed')
             return result
 
     def _process_ask_order(self, order: AskOrder) -> ResultBuilder:
-        self._logger.info(f'processing ask order {order.id()}')
-
         if self._is_market_ask(order):
-            self._logger.info(f'ask order {order.id()} is market')
-
             if (error := self._check_ask_market_order(order)) is not None: 
                 order.set_status(OrderStatus.ERROR)
                 result = ResultBuilder.new_market(order.id())
@@ -305,53 +320,59 @@ class Orderbook:
 
             if order.status() == OrderStatus.PARTIAL: 
                 with self._ask_side.lock(): self._ask_side.place(order)
-                self._logger.info(f'order {order.id()} partially executed, rest was placed as limit order')
 
-            self._logger.info(f'executed ask market order {order.id()}')
             return result
 
         else: # is limit order
-            self._logger.info(f'order {order.id()} is limit order')
-
             result = ResultBuilder.new_limit(order.id())
 
             if (error := self._check_limit_order(order)) is not None: 
                 order.set_status(OrderStatus.ERROR)
                 result.set_success(False)
                 result.add_message(error)
-                self._logger.error(error)
-                return error
+                return result
 
             # place the order in the side
             with self._ask_side.lock(): self._ask_side.place(order)
 
-            self._logger.info(f'order {order.id()} successfully placed')
             result.set_success(True)
             return result
 
     def _save_order(self, order):
-        self._logger.info(f'adding order to dict')
-        self._orders[order.id()] = order
+        self._orders.add(order)
+
+        if order.otype() == OrderType.GTD and order.valid(): 
+            with self._expiry_cond:
+                if self._expiries.push(order): self._expiry_cond.notify()
 
-        if order.otype() == OrderType.GTD: 
-            self._logger.info(f'order is GTD, adding order to expiry map')
-            if order.expiry() not in self._expirymap.keys(): self._expirymap[order.expiry()] = list()
-            self._expirymap[order.expiry()].append(order)
+    def _emit_processed(self, order: Order, result: ResultBuilder) -> None:
+        '''Send the events corresponding to the processing of an order to the sink.'''
+        sink = self._sink
+
+        if not result._success:
+            message = result._messages[-1] if result._messages else None
+            sink.emit(EventType.REJECTED, order.id(), order.side(), order.price(), order.quantity(), message)
+            return
+
+        if result._KIND == ResultType.MARKET:
+            filled = sum(result._execprices.values())
+            sink.emit(EventType.FILLED, order.id(), order.side(), order.price(), filled)
+
+        if order.valid(): sink.emit(EventType.ACCEPTED, order.id(), order.side(), order.price(), order.quantity())
 
     def _is_market_ask(self, order: AskOrder) -> bool:
         if self._bid_side.empty(): return False
-        if self.best_bid() >= order.price(): return True
+        if self._bid_side.best()._price >= order._price: return True
         return False
 
     def _is_market_bid(self, order: BidOrder) -> bool:
         if self._ask_side.empty(): return False
-        if self.best_ask() <= order.price(): return True
+        if self._ask_side.best()._price <= order._price: return True
         return False
 
     def _check_limit_order(self, order: Order) -> Optional[str]:
         match order.otype():
             case OrderType.FOK: # FOK order can not be a limit order by definition
-                self._logger.error(f'FOK order {order.id()} is not immediately matchable')
                 return 'FOK order is not immediately matchable'
 
         return None
@@ -374,57 +395,72 @@ class Orderbook:
 
     def _immediately_matchable_bid(self, order: BidOrder) -> bool:
         # we want the limit volume down to the order price to be >= order quantity
-        volume = zero()
+        volume = 0
         limits = self._ask_side._limits.values()
 
         lim : Limit
         for lim in limits:
-            if lim.price() > order.price(): break
-            if volume >= order.quantity():  break
-            volume += lim.volume()
+            if lim._price > order._price: break
+            if volume >= order._quantity:  break
+            volume += lim._volume
 
-        if volume < order.quantity(): return False
+        if volume < order._quantity: return False
         return True
 
     def _immediately_matchable_ask(self, order: AskOrder) -> bool:
         # we want the limit volume down to the order price to be >= order quantity
-        volume = zero()
+        volume = 0
         limits = self._bid_side._limits.values()
 
         lim : Limit
         for lim in limits:
-            if lim.price() < order.price(): break
-            if volume >= order.quantity():  break
-            volume += lim.volume()
+            if lim._price < order._price: break
+            if volume >= order._quantity:  break
+            volume += lim._volume
 
-        if volume < order.quantity(): return False
+        if volume < order._quantity: return False
         return True
 
-    def _cancel_expired_orders(self):
-        '''Background expired orders cleaner.'''
+    def _expiry_loop(self) -> None:
+        '''Background GTD orders manager, sleeps until the next expiry is due (or the book is stopped).'''
+
+        while True:
+            with self._expiry_cond:
+                if not self._alive: return
+
+                due = self._expiries.next_due()
+                if due is None: self._expiry_cond.wait(); continue
+
+                timeout = (due - time_asms()) / 1000
+                if timeout > 0: self._expiry_cond.wait(min(timeout, threading.TIMEOUT_MAX)); continue
+
+            self._expire_due()
 
-        timestamps = self._expirymap.keys()
-        if not timestamps: return
+    def _expire_due(self) -> None:
+        '''Expire all the orders that are due, in one batch per side.'''
 
-        now = time_asint()
-        keys_outdated = filter(lambda timestamp: timestamp < now, timestamps)
+        with self._expiry_cond: expired = self._expiries.pop_due(time_asms())
 
-        for key in keys_outdated:
-            expired_orders = self._expirymap[key]
+        expired = [order for order in expired if order.valid()]
+        if not expired: return
 
-            self._logger.info(f'GTD orders manager: cancelling {len(expired_orders)} with t={key}')
+        for side in (self._bid_side, self._ask_side):
+            orders = [order for order in expired if order._side == side._side]
+            if not orders: continue
 
-            for order in expired_orders:
-                if not order.valid(): continue
+            with side.lock():
+                for order in orders:
+                    if not order.valid(): continue # filled or canceled meanwhile
+                    side.cancel_order(order)
+                    order.set_status(OrderStatus.EXPIRED)
 
-                match order.side():
-                    case OrderSide.ASK: 
-                        with self._ask_side.lock(): self._ask_side.cancel_order(order)
+        for order in expired:
+            if order.status() != OrderStatus.EXPIRED: continue
 
-                    case OrderSide.BID: 
-                        with self._bid_side.lock(): self._bid_side.cancel_order(order)
+            self._orders.retire(order)
 
-            del self._expirymap[key]
+            if self._sink is not None:
+                self._sink.emit(EventType.EXPIRED, order.id(), order.side(), order.price(), order.quantity())
 
     def view(self, n : int = DEFAULT_LIMITS_VIEW) -> str:
         '''Outputs the order-book in the following format:\n
@@ -1,46 +1,61 @@
-import abc, secrets
+import abc, itertools
 from typing import Optional
-from decimal import Decimal
-from dataclasses import dataclass
 
 from fastlob.enums import OrderSide, OrderType, OrderStatus
-from fastlob.consts import ORDERS_ID_SIZE
+from fastlob.utils import fromfixed, tostrid
 from .params import OrderParams
 
-@dataclass
+_orderids = itertools.count(1)
+# ^ shared by every book of the process, ids are sequential and never reused
+
 class Order(abc.ABC):
-    '''Base abstract class for orders in the order-book. Extended by `BidOrder` and `AskOrder`.'''
+    '''Base abstract class for orders in the order-book. Extended by `BidOrder` and `AskOrder`.
+
+    Orders are kept by the million in the book, attributes are therefore stored in `__slots__` (no per-instance 
+    `__dict__`) and the side is a class attribute of `BidOrder` and `AskOrder`.
+    '''
 
-    _id: str
+    __slots__ = ('_id', '_price', '_quantity', '_otype', '_expiry', '_status', '_prev', '_next')
+
+    _id: int
     _side: OrderSide
-    _price: Decimal
-    _quantity: Decimal
+    _price: int
+    _quantity: int
     _otype: OrderType
     _expiry: Optional[float]
     _status: OrderStatus
+    _prev: Optional['Order']
+    _next: Optional['Order']
+    # ^ intrusive links of the limit queue the order sits in, managed by `Limit`
 
     def __init__(self, params: OrderParams):
-        self._id       = secrets.token_urlsafe(nbytes=ORDERS_ID_SIZE)
-        self._price    = params.price
-        self._quantity = params.quantity
+        self._id       = next(_orderids)
+        self._price    = params._ticks
+        self._quantity = params._lots
         self._otype    = params.otype
         self._expiry   = params.expiry
         self._status   = OrderStatus.CREATED
+        self._prev     = None
+        self._next     = None
 
-    def id(self) -> str:
+    def id(self) -> int:
         '''Getter for order identifier.'''
         return self._id
 
+    def strid(self) -> str:
+        '''Getter for the fixed-width string form of the order identifier.'''
+        return tostrid(self._id)
+
     def side(self) -> OrderSide:
         '''Getter for order side.'''
         return self._side
 
-    def price(self) -> Decimal:
-        '''Getter for order price.'''
+    def price(self) -> int:
+        '''Getter for order price (in ticks).'''
         return self._price
 
-    def quantity(self) -> Decimal:
-        '''Getter for order quantity.'''
+    def quantity(self) -> int:
+        '''Getter for order quantity (in lots).'''
         return self._quantity
 
     def otype(self) -> OrderType:
@@ -59,12 +74,12 @@ class Order(abc.ABC):
         '''Set the order status.'''
         self._status = status
 
-    def fill(self, quantity: Decimal):
+    def fill(self, quantity: int):
         '''Decrease the quantity of the order by some numerical value. If `quantity` is greater than the order qty, 
         we set it to 0.
         '''
         self._quantity -= min(quantity, self._quantity)
-        if self.quantity() == 0: self.set_status(OrderStatus.FILLED); return
+        if self._quantity == 0: self.set_status(OrderStatus.FILLED); return
         self.set_status(OrderStatus.PARTIAL)
 
     def valid(self) -> bool:
@@ -76,21 +91,19 @@ class Order(abc.ABC):
         return self.id() == other.id()
 
     def __repr__(self) -> str:
-        return f'{self._side.name}Order(id={self.id()}, status={self.status()}, price={self.price()}, ' + \
-            f'quantity={self.quantity()}, type={self.otype()})'
+        return f'{self._side.name}Order(id={self.id()}, status={self.status()}, price={fromfixed(self.price())}, ' + \
+            f'quantity={fromfixed(self.quantity())}, type={self.otype()})'
 
-@dataclass
 class BidOrder(Order):
     '''A bid (buy) order.'''
 
-    def __init__(self, params: OrderParams):
-        super().__init__(params)
-        self._side = OrderSide.BID
+    __slots__ = ()
+
+    _side = OrderSide.BID
 
-@dataclass
 class AskOrder(Order):
     '''An ask (sell) order.'''
 
-    def __init__(self, params: OrderParams):
-        super().__init__(params)
-        self._side = OrderSide.ASK
\ No newline at end of file
+    __slots__ = ()
+
+    _side = OrderSide.ASK
\ No newline at end of file
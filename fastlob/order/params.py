@@ -1,11 +1,10 @@
 import time
-from math import ceil
 from decimal import Decimal
 from numbers import Number
 from typing import Optional
 
 from fastlob.enums import OrderSide, OrderType
-from fastlob.utils import todecimal
+from fastlob.utils import todecimal, tofixed
 from fastlob.consts import MIN_VALUE, MAX_VALUE
 
 class OrderParams:
@@ -17,7 +16,9 @@ class OrderParams:
     price: Decimal
     quantity: Decimal
     otype: OrderType
-    expiry: Optional[int]
+    expiry: Optional[float]
+    _ticks: int
+    _lots: int
 
     def __init__(self, side: OrderSide, price: Number, quantity: Number, otype: OrderType = OrderType.GTC,
                  expiry: Optional[Number] = None):
@@ -28,7 +29,11 @@ class OrderParams:
         self.price    = todecimal(price)
         self.quantity = todecimal(quantity)
         self.otype    = otype
-        self.expiry   = int(expiry) if expiry is not None else None
+        self.expiry   = round(float(expiry), 3) if expiry is not None else None # millisecond resolution
+
+        # fixed-point representation used by the book internally
+        self._ticks = tofixed(self.price)
+        self._lots  = tofixed(self.quantity)
 
     @staticmethod
     def check_args(side: OrderSide, price: Number, quantity: Number, otype: OrderType, 
@@ -54,9 +59,9 @@ class OrderParams:
         if otype == OrderType.GTD: 
             if expiry is None: raise ValueError('order is GTD but expiry is None')
 
-            expiry = int(expiry)
-            now = ceil(time.time())
-            if expiry <= now: raise ValueError(f'order expiry ({expiry}) is less than current timestamp ({now}), or too close')
+            expiry = round(float(expiry), 3)
+            now = time.time()
+            if expiry <= now: raise ValueError(f'order expiry ({expiry}) is less than current timestamp ({now})')
 
         price_decimal = todecimal(price)
         quantity_decimal = todecimal(quantity)
@@ -73,7 +78,7 @@ class OrderParams:
         if quantity_decimal > MAX_VALUE: 
             raise ValueError(f'quantity ({quantity}) is too large')
 
-    def unwrap(self) -> tuple[Decimal, Decimal, OrderType, Optional[int]]:
+    def unwrap(self) -> tuple[Decimal, Decimal, OrderType, Optional[float]]:
         return self.price, self.quantity, self.otype, self.expiry
 
     def __repr__(self) -> str:
@@ -0,0 +1,37 @@
+'''Fixed-width binary record of an order, used to store orders on disk.'''
+
+import math, struct
+from typing import NamedTuple, Optional
+
+from fastlob.enums import OrderSide, OrderType, OrderStatus
+
+RECORD = struct.Struct('<qqqdBBB5x')
+'''id, price (ticks), quantity (lots), expiry (nan if none), side, type, status, padding to 40 bytes.'''
+
+_OTYPES   = list(OrderType)
+_STATUSES = list(OrderStatus)
+_OTYPE_CODES   = {otype: code for code, otype in enumerate(_OTYPES)}
+_STATUS_CODES  = {status: code for code, status in enumerate(_STATUSES)}
+
+class OrderRecord(NamedTuple):
+    '''An order decoded from its binary record.'''
+
+    id: int
+    price: int
+    quantity: int
+    expiry: Optional[float]
+    side: OrderSide
+    otype: OrderType
+    status: OrderStatus
+
+def pack(order) -> bytes:
+    '''Encode an order into its binary record.'''
+    expiry = order._expiry if order._expiry is not None else math.nan
+    return RECORD.pack(order._id, order._price, order._quantity, expiry, order._side.value, 
+                       _OTYPE_CODES[order._otype], _STATUS_CODES[order._status])
+
+def unpack(buffer, offset: int = 0) -> OrderRecord:
+    '''Decode the binary record starting at `offset` in `buffer`.'''
+    orderid, price, quantity, expiry, side, otype, status = RECORD.unpack_from(buffer, offset)
+    return OrderRecord(orderid, price, quantity, None if math.isnan(expiry) else expiry, 
+                       OrderSide(bool(side)), _OTYPES[otype], _STATUSES[status])
@@ -0,0 +1,2 @@
+from .registry import OrderRegistry, RetentionPolicy
+from .archive import OrderArchive
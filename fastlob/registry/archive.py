@@ -0,0 +1,57 @@
+import os, mmap, struct
+from typing import Optional
+
+from fastlob.enums import OrderStatus
+from fastlob.order import Order, record
+
+_ID = struct.Struct('<q')
+
+class OrderArchive:
+    '''Append-only on-disk store of the orders evicted from the registry of the book. Each order is a fixed-width 
+    binary record (see `fastlob.order.record`), lookups search the memory-mapped file so nothing is kept in memory.'''
+
+    _path: str
+    _file: object
+
+    def __init__(self, path: str):
+        '''
+        Args:
+            path (str): File the orders are appended to, created if it does not exist.
+        '''
+        self._path = path
+        self._file = open(path, 'ab')
+
+    def path(self) -> str:
+        '''Getter for the archive file path.'''
+        return self._path
+
+    def append(self, order: Order) -> None:
+        '''Archive an order.'''
+        self._file.write(record.pack(order))
+
+    def get(self, orderid: int) -> Optional[record.OrderRecord]:
+        '''Get the last archived record of an order, or None if it was never archived.'''
+        self._file.flush()
+        if os.path.getsize(self._path) == 0: return None
+
+        key, size = _ID.pack(orderid), record.RECORD.size
+
+        with open(self._path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            position = buffer.rfind(key)
+            while position != -1 and position % size != 0: # id bytes found inside another field
+                position = buffer.rfind(key, 0, position + len(key) - 1)
+
+            if position == -1: return None
+            return record.unpack(buffer, position)
+
+    def status(self, orderid: int) -> Optional[tuple[OrderStatus, int]]:
+        '''Get the status and the quantity left of an archived order.'''
+        archived = self.get(orderid)
+        if archived is None: return None
+        return archived.status, archived.quantity
+
+    def close(self) -> None:
+        '''Flush and close the archive file.'''
+        self._file.close()
+
+    def __repr__(self) -> str: return f'OrderArchive(path={self._path})'
@@ -0,0 +1,117 @@
+import time
+from typing import Optional, Iterable
+from collections import OrderedDict
+
+from fastlob.order import Order
+from fastlob.enums import OrderStatus
+from .archive import OrderArchive
+
+class RetentionPolicy:
+    '''Defines when orders that reached a terminal state (filled, canceled, expired) are evicted from the registry.'''
+
+    _ttl: Optional[float]
+    _capacity: Optional[int]
+    _lru: bool
+
+    def __init__(self, ttl: Optional[float] = None, capacity: Optional[int] = None, lru: bool = False):
+        '''
+        Args:
+            ttl (Optional[float]): Seconds a terminal order is kept for.
+            capacity (Optional[int]): Maximum number of terminal orders kept, the oldest ones are evicted first.
+            lru (bool): If True, querying a terminal order refreshes it, the least recently used ones are evicted 
+                first. Requires a `capacity` and no `ttl`.
+        '''
+        if ttl is not None and ttl < 0: raise ValueError(f'ttl ({ttl}) must be positive')
+        if capacity is not None and capacity < 0: raise ValueError(f'capacity ({capacity}) must be positive')
+        if lru and (capacity is None or ttl is not None): raise ValueError('lru eviction requires a capacity only')
+
+        self._ttl      = ttl
+        self._capacity = capacity
+        self._lru      = lru
+
+    @staticmethod
+    def by_ttl(seconds: float): return RetentionPolicy(ttl=seconds)
+
+    @staticmethod
+    def by_count(n: int): return RetentionPolicy(capacity=n)
+
+    @staticmethod
+    def by_lru(n: int): return RetentionPolicy(capacity=n, lru=True)
+
+    def __repr__(self) -> str:
+        return f'RetentionPolicy(ttl={self._ttl}, capacity={self._capacity}, lru={self._lru})'
+
+class OrderRegistry:
+    '''The orders known by the book, indexed by id. Without a retention policy every order is kept forever, 
+    otherwise terminal orders are evicted according to the policy and sent to the archive (if any).'''
+
+    _orders: dict[int, Order]
+    _terminal: OrderedDict[int, float]
+    _policy: Optional[RetentionPolicy]
+    _archive: Optional[OrderArchive]
+
+    def __init__(self, policy: Optional[RetentionPolicy] = None, archive: Optional[OrderArchive] = None):
+        self._orders   = dict()
+        self._terminal = OrderedDict() # terminal order id -> time it was retired, in eviction order
+        self._policy   = policy
+        self._archive  = archive
+
+    def policy(self) -> Optional[RetentionPolicy]: return self._policy
+
+    def archive(self) -> Optional[OrderArchive]: return self._archive
+
+    def add(self, order: Order) -> None:
+        '''Register an order.'''
+        self._orders[order._id] = order
+
+    def get(self, orderid: int) -> Optional[Order]:
+        '''Get a live order (not evicted), or None.'''
+        order = self._orders.get(orderid)
+        if order is not None and self._policy is not None and self._policy._lru and orderid in self._terminal:
+            self._terminal.move_to_end(orderid)
+        return order
+
+    def status(self, orderid: int) -> Optional[tuple[OrderStatus, int]]:
+        '''Get the status and quantity left (lots) of an order, live or archived.'''
+        order = self.get(orderid)
+        if order is not None: return order._status, order._quantity
+        if self._archive is not None: return self._archive.status(orderid)
+        return None
+
+    def retire(self, order: Order) -> None:
+        '''Notify the registry that an order may have reached a terminal state, making it evictable.'''
+        if self._policy is None or order.valid(): return
+        if order._id in self._terminal or order._id not in self._orders: return
+
+        self._terminal[order._id] = time.time()
+        self._evict()
+
+    def retire_many(self, orders: Iterable[Order]) -> None:
+        '''Same as `retire` for many orders.'''
+        if self._policy is None: return
+        for order in orders: self.retire(order)
+
+    def live(self) -> int:
+        '''Number of orders in the registry.'''
+        return len(self._orders)
+
+    def _evict(self) -> None:
+        policy, terminal = self._policy, self._terminal
+
+        if policy._capacity is not None:
+            while len(terminal) > policy._capacity: self._drop(terminal.popitem(last=False)[0])
+
+        if policy._ttl is not None:
+            deadline = time.time() - policy._ttl
+            while terminal and next(iter(terminal.values())) <= deadline: self._drop(terminal.popitem(last=False)[0])
+
+    def _drop(self, orderid: int) -> None:
+        order = self._orders.pop(orderid)
+        if self._archive is not None: self._archive.append(order)
+
+    def __len__(self) -> int: return len(self._orders)
+
+    def __contains__(self, orderid: int) -> bool: return orderid in self._orders
+
+    def __repr__(self) -> str:
+        return f'OrderRegistry(live={len(self._orders)}, terminal={len(self._terminal)}, policy={self._policy})'
@@ -3,32 +3,36 @@ from typing import Optional
 from collections import defaultdict
 
 from fastlob.enums import ResultType
+from fastlob.utils import fromfixed, tostrid
 
 class ResultBuilder:
     '''The object constructed by the lob during order processing.'''
 
     _KIND: ResultType
     _success: bool
-    _ORDERID: str
+    _ORDERID: Optional[int]
     _messages: list[str]
     _orders_matched: int
-    _execprices: Optional[defaultdict[Decimal, Decimal]]
+    _execprices: Optional[defaultdict[int, int]]
+    _filled: Optional[list]
+    # ^ limit orders entirely filled by the engine, not part of the execution result
 
-    def __init__(self, kind: ResultType, orderid: str):
+    def __init__(self, kind: ResultType, orderid: Optional[int]):
         self._KIND = kind
         self._ORDERID = orderid
         self._messages = list()
         self._orders_matched = 0
-        self._execprices = defaultdict(Decimal) if kind == ResultType.MARKET else None
+        self._execprices = defaultdict(int) if kind == ResultType.MARKET else None
+        self._filled = list() if kind == ResultType.MARKET else None
 
     @staticmethod
-    def new_limit(orderid: str): return ResultBuilder(ResultType.LIMIT, orderid)
+    def new_limit(orderid: int): return ResultBuilder(ResultType.LIMIT, orderid)
 
     @staticmethod
-    def new_market(orderid: str): return ResultBuilder(ResultType.MARKET, orderid)
+    def new_market(orderid: int): return ResultBuilder(ResultType.MARKET, orderid)
 
     @staticmethod
-    def new_cancel(orderid: str): return ResultBuilder(ResultType.CANCEL, orderid)
+    def new_cancel(orderid: int): return ResultBuilder(ResultType.CANCEL, orderid)
 
     @staticmethod
     def new_error(): 
@@ -52,7 +56,7 @@ class ExecutionResult:
     '''The object returned to the client.'''
     _KIND: ResultType
     _success: bool
-    _ORDERID: str
+    _ORDERID: Optional[int]
     _messages: list[str]
     _orders_matched: int
     _execprices: Optional[defaultdict[Decimal, Decimal]]
@@ -63,13 +67,17 @@ class ExecutionResult:
         self._success = result._success
         self._messages = result._messages
         self._orders_matched = result._orders_matched
-        self._execprices = result._execprices
+        self._execprices = ExecutionResult._todecimal(result._execprices)
 
     def kind(self) -> ResultType: return self._KIND
 
     def success(self) -> bool: return self._success
 
-    def orderid(self) -> str: return self._ORDERID
+    def orderid(self) -> Optional[int]: return self._ORDERID
+
+    def orderid_str(self) -> Optional[str]: 
+        '''String form of the order identifier, can be used in place of it when querying the book.'''
+        return tostrid(self._ORDERID) if self._ORDERID is not None else None
 
     def messages(self) -> list[str]: return self._messages.copy()
 
@@ -77,6 +85,14 @@ class ExecutionResult:
 
     def execprices(self) -> Optional[defaultdict[Decimal, Decimal]]: return self._execprices.copy()
 
+    @staticmethod
+    def _todecimal(execprices: Optional[defaultdict[int, int]]) -> Optional[defaultdict[Decimal, Decimal]]:
+        '''Convert the fixed-point execution prices built by the engine to decimals.'''
+        if execprices is None: return None
+        converted = defaultdict(Decimal)
+        for price, quantity in execprices.items(): converted[fromfixed(price)] = fromfixed(quantity)
+        return converted
+
     def __repr__(self) -> str:
         return f'ClientResult(type={self.kind().name}, success={self.success()}, ' + \
             f'orderid={self.orderid()}, messages={self.messages()})'
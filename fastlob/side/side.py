@@ -1,24 +1,23 @@
 import io, abc, threading
-from decimal import Decimal
 from sortedcollections import SortedDict
 
 from fastlob.limit import Limit
 from fastlob.order import Order
-from fastlob.utils import zero
+from fastlob.utils import fromfixed
 from fastlob.enums import OrderSide
 
 class Side(abc.ABC):
     '''A side is a collection of limits, whose ordering by price depends if it is the bid or ask side.'''
 
     _side: OrderSide
-    _volume: Decimal
-    _limits: SortedDict[Decimal, Limit]
+    _volume: int
+    _limits: SortedDict[int, Limit]
     _mutex: threading.Lock 
     # ^ the role of this mutex is to prevent a limit order being canceled meanwhile we are matching a market order
     # it must be locked by any other class before it can execute or cancel an order in the side 
 
     def __init__(self): 
-        self._volume = zero()
+        self._volume = 0
         self._mutex = threading.Lock()
 
     def lock(self): return self._mutex
@@ -27,8 +26,8 @@ class Side(abc.ABC):
         '''Get the side of the limit.'''
         return self._side
 
-    def volume(self) -> Decimal:
-        '''Getter for side volume, that is the sum of the volume of all limits.'''
+    def volume(self) -> int:
+        '''Getter for side volume, that is the sum of the volume of all limits (in lots).'''
         return self._volume
 
     def size(self) -> int:
@@ -45,37 +44,38 @@ class Side(abc.ABC):
 
     def place(self, order: Order) -> None:
         '''Place an order in the side at its corresponding limit.'''
-        price = order.price()
+        price = order._price
         self._new_price_if_not_exists(price)
         self._get_limit(price).enqueue(order)
-        self._volume += order.quantity()
+        self._volume += order._quantity
 
     def cancel_order(self, order: Order) -> None:
         '''Cancel an order sitting in the side.'''
-        self._volume -= order.quantity()
-        lim = self._get_limit(order.price())
+        self._volume -= order._quantity
+        lim = self._get_limit(order._price)
         lim.cancel_order(order)
         if lim.empty(): del self._limits[lim.price()]
 
-    def _get_limit(self, price: Decimal) -> Limit:
+    def _get_limit(self, price: int) -> Limit:
         '''Get the limit sitting at a certain price.'''
         return self._limits[price]
 
-    def _price_exists(self, price: Decimal) -> bool:
+    def _price_exists(self, price: int) -> bool:
         '''Check there is a limit at a certain price.'''
-        return price in self._limits.keys()
+        return price in self._limits
 
-    def _new_price(self, price: Decimal) -> None:
+    def _new_price(self, price: int) -> None:
         '''Add a limit to the side.'''
         self._limits[price] = Limit(price)
 
-    def _new_price_if_not_exists(self, price: Decimal) -> None:
+    def _new_price_if_not_exists(self, price: int) -> None:
         '''Create price level if not exists.'''
         if not self._price_exists(price): self._new_price(price)
 
     def __repr__(self) -> str:
-        if self.empty(): return f'{self.side().name}Side(size={self.size()}, volume={self.volume()})'
-        return f'{self.side().name}Side(size={self.size()}, volume={self.volume()}, best={self.best()})'
+        volume = fromfixed(self.volume())
+        if self.empty(): return f'{self.side().name}Side(size={self.size()}, volume={volume})'
+        return f'{self.side().name}Side(size={self.size()}, volume={volume}, best={self.best()})'
 
     @abc.abstractmethod
     def view(self, n : int) -> str: pass
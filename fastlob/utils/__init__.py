@@ -1 +1 @@
-from .utils import todecimal, zero, time_asint
+from .utils import todecimal, tofixed, fromfixed, tostrid, fromstrid, zero, time_asint, time_asms
@@ -2,7 +2,7 @@ import time
 from decimal import Decimal
 from numbers import Number
 
-from fastlob.consts import DECIMAL_PRECISION
+from fastlob.consts import DECIMAL_PRECISION, ORDERS_ID_SIZE
 
 def todecimal(n: Number | str) -> Decimal:
     '''Wrapper around the Decimal constructor to properly round numbers to user defined precision.'''
@@ -13,6 +13,24 @@ def todecimal(n: Number | str) -> Decimal:
 
     return dec.quantize(exp)
 
+def tofixed(n: Decimal) -> int:
+    '''Convert a decimal (already rounded by `todecimal`) to its integer number of ticks or lots.'''
+    return int(n.scaleb(DECIMAL_PRECISION))
+
+def fromfixed(n: int) -> Decimal:
+    '''Convert an integer number of ticks or lots back to a decimal at user defined precision.'''
+    return Decimal(n).scaleb(-DECIMAL_PRECISION)
+
+def tostrid(orderid: int) -> str:
+    '''Fixed-width (hexadecimal) string form of an order identifier.'''
+    return format(orderid, f'0{2 * ORDERS_ID_SIZE}x')
+
+def fromstrid(orderid: str) -> int:
+    '''Parse an order identifier from its string form (see `tostrid`).'''
+    return int(orderid, 16)
+
 def zero(): return Decimal('0')
 
 def time_asint() -> int: return int(time.time())
+
+def time_asms() -> int: return int(time.time() * 1000)
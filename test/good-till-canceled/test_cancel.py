@@ -29,4 +29,23 @@ class TestCancelGTC(unittest.TestCase):
         self.assertTrue(cr.success())
         self.assertEqual(self.lob.n_prices(), 0)
 
+        self.lob.stop()
+
+    @given(valid_side, valid_price, valid_price)
+    def test_cancel_one_limit_strid(self, side, price, qty):
+        self.lob = Orderbook('TestCancelGTC')
+        self.lob.start()
+
+        p = OrderParams(side, price, qty, OrderType.GTC, expiry=None)
+
+        r = self.lob(p)
+
+        s, _ = self.lob.get_status(r.orderid_str())
+        self.assertEqual(s, OrderStatus.PENDING)
+
+        cr = self.lob.cancel(r.orderid_str())
+
+        self.assertTrue(cr.success())
+        self.assertEqual(self.lob.n_prices(), 0)
+
         self.lob.stop()
\ No newline at end of file
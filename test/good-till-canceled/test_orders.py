@@ -3,6 +3,7 @@ from hypothesis import given, strategies as st
 
 from fastlob import Orderbook, OrderParams, OrderSide, OrderType, OrderStatus, todecimal, ResultType
 from fastlob.consts import MIN_VALUE, MAX_VALUE
+from fastlob.utils import tofixed
 
 valid_side = st.sampled_from(OrderSide)
 valid_price = st.decimals(min_value=MIN_VALUE, max_value=MAX_VALUE, allow_nan=False, allow_infinity=False)
@@ -294,4 +295,20 @@ class TestOrdersGTC(unittest.TestCase):
             self.assertEqual(s, OrderStatus.FILLED)
             self.assertEqual(q, 0)
 
-        self.lob.stop()
\ No newline at end of file
+        self.lob.stop()
+
+    def test_fill_whole_orders(self):
+        self.lob = Orderbook('TestGTC')
+        self.lob.start()
+
+        results = self.lob([OrderParams(OrderSide.ASK, 100, 10) for _ in range(3)])
+        mr = self.lob(OrderParams(OrderSide.BID, 100, 25))
+
+        self.assertEqual(mr.n_orders_matched(), 2)
+        self.assertDictEqual(mr.execprices(), {todecimal(100): 25})
+
+        for r in results[:2]: self.assertEqual(self.lob.get_status(r.orderid()), (OrderStatus.FILLED, 0))
+        self.assertEqual(self.lob.get_status(results[2].orderid()), (OrderStatus.PARTIAL, 5))
+        self.assertEqual(self.lob._ask_side.volume(), tofixed(todecimal(5)))
+
+        self.lob.stop()
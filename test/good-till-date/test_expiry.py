@@ -0,0 +1,74 @@
+import unittest, logging, time
+
+from fastlob import Orderbook, OrderParams, OrderSide, OrderType, OrderStatus, EventType
+
+class TestExpiryGTD(unittest.TestCase):
+    def setUp(self): 
+        logging.basicConfig(level=logging.ERROR)
+
+    def test_expire_one(self):
+        self.lob = Orderbook('TestExpiryGTD')
+        self.lob.start()
+
+        events = list()
+        self.lob.attach(events.append)
+
+        r = self.lob(OrderParams(OrderSide.BID, 100, 10, OrderType.GTD, expiry=time.time() + 0.3))
+
+        time.sleep(0.1)
+        self.assertEqual(self.lob.get_status(r.orderid())[0], OrderStatus.PENDING)
+        self.assertEqual(self.lob.n_bids(), 1)
+
+        time.sleep(0.4)
+        self.assertEqual(self.lob.get_status(r.orderid())[0], OrderStatus.EXPIRED)
+        self.assertEqual(self.lob.n_bids(), 0)
+        self.assertEqual(events[-1].kind, EventType.EXPIRED)
+
+        self.lob.stop()
+
+    def test_expire_many(self):
+        self.lob = Orderbook('TestExpiryGTD')
+        self.lob.start()
+
+        expiry = time.time() + 0.2
+        results = self.lob([OrderParams(OrderSide.ASK, 100 + i, 10, OrderType.GTD, expiry=expiry) for i in range(50)])
+        results += self.lob([OrderParams(OrderSide.BID, 50 + i, 10, OrderType.GTD, expiry=expiry) for i in range(50)])
+        gtc = self.lob(OrderParams(OrderSide.BID, 10, 10))
+
+        time.sleep(0.4)
+        for r in results: self.assertEqual(self.lob.get_status(r.orderid())[0], OrderStatus.EXPIRED)
+        self.assertEqual(self.lob.get_status(gtc.orderid())[0], OrderStatus.PENDING)
+        self.assertEqual(self.lob.n_prices(), 1)
+        self.assertEqual(len(self.lob._expiries), 0)
+
+        self.lob.stop()
+
+    def test_expired_at_match_time(self):
+        self.lob = Orderbook('TestExpiryGTD')
+        self.lob._expiry_loop = lambda: None # no background expiry
+        self.lob.start()
+
+        r = self.lob(OrderParams(OrderSide.ASK, 100, 10, OrderType.GTD, expiry=time.time() + 0.1))
+        time.sleep(0.2)
+        self.assertEqual(self.lob.get_status(r.orderid())[0], OrderStatus.PENDING)
+
+        mr = self.lob(OrderParams(OrderSide.BID, 100, 10))
+
+        self.assertEqual(self.lob.get_status(r.orderid())[0], OrderStatus.EXPIRED)
+        self.assertEqual(self.lob.get_status(mr.orderid())[0], OrderStatus.PENDING)
+        self.assertEqual(self.lob.n_asks(), 0)
+
+        self.lob.stop()
+
+    def test_filled_before_expiry(self):
+        self.lob = Orderbook('TestExpiryGTD')
+        self.lob.start()
+
+        r = self.lob(OrderParams(OrderSide.ASK, 100, 10, OrderType.GTD, expiry=time.time() + 0.1))
+        self.lob(OrderParams(OrderSide.BID, 100, 10))
+
+        time.sleep(0.2)
+        self.assertEqual(self.lob.get_status(r.orderid())[0], OrderStatus.FILLED)
+        self.assertEqual(self.lob.n_prices(), 0)
+
+        self.lob.stop()
@@ -0,0 +1,66 @@
+import unittest, logging
+
+from fastlob import Orderbook, OrderParams, OrderSide, OrderType, EventType, QueueWriter
+
+class TestEvents(unittest.TestCase):
+    def setUp(self): 
+        self.lob = Orderbook('TestEvents')
+        self.lob.start()
+
+    def tearDown(self): 
+        self.lob.stop()
+
+    def test_no_sink(self):
+        self.assertIsNone(self.lob._sink)
+
+        events = list()
+        self.lob.attach(events.append)
+        self.assertIsNotNone(self.lob._sink)
+
+        self.lob.detach(events.append)
+        self.assertIsNone(self.lob._sink)
+
+        self.lob(OrderParams(OrderSide.BID, 100, 10))
+        self.assertEqual(events, [])
+
+    def test_order_lifecycle(self):
+        events = list()
+        self.lob.attach(events.append)
+
+        r1 = self.lob(OrderParams(OrderSide.BID, 100, 10))
+        r2 = self.lob(OrderParams(OrderSide.ASK, 100, 4))
+        self.lob.cancel(r1.orderid())
+        self.lob(OrderParams(OrderSide.ASK, 100, 4, OrderType.FOK))
+
+        kinds = [(e.kind, e.orderid) for e in events]
+        self.assertEqual(kinds, [
+            (EventType.ACCEPTED, r1.orderid()),
+            (EventType.FILLED, r2.orderid()),
+            (EventType.CANCELED, r1.orderid()),
+            (EventType.REJECTED, r2.orderid() + 1),
+        ])
+
+        self.assertEqual(events[1].quantity, 400)
+        self.assertEqual(events[2].quantity, 600)
+
+    def test_level_and_sample(self):
+        warnings, sampled = list(), list()
+        self.lob.attach(warnings.append, level=logging.WARNING)
+        self.lob.attach(sampled.append, sample=3)
+
+        for _ in range(9): self.lob(OrderParams(OrderSide.BID, 100, 10))
+        self.lob.cancel(-1)
+
+        self.assertEqual([e.kind for e in warnings], [EventType.REJECTED])
+        self.assertEqual(len(sampled), 3)
+
+    def test_queue_writer(self):
+        events = list()
+        writer = QueueWriter(events.append)
+        self.lob.attach(writer)
+
+        for _ in range(100): self.lob(OrderParams(OrderSide.ASK, 100, 10))
+
+        writer.close()
+        self.assertEqual(len(events), 100)
+        self.assertTrue(all(e.kind == EventType.ACCEPTED for e in events))
@@ -7,7 +7,7 @@ from fastlob.limit import Limit
 from fastlob.enums import OrderSide, OrderStatus, OrderType
 from fastlob.order import OrderParams, BidOrder, AskOrder
 from fastlob.consts import MIN_VALUE, MAX_VALUE
-from fastlob.utils import todecimal
+from fastlob.utils import todecimal, tofixed
 
 valid_side = st.sampled_from(OrderSide)
 valid_price = st.floats(min_value=float(MIN_VALUE), max_value=float(MAX_VALUE), allow_nan=False, allow_infinity=False)
@@ -23,7 +23,7 @@ class TestLimit(unittest.TestCase):
 
     @given(valid_price)
     def test_init(self, price):
-        price = todecimal(price)
+        price = tofixed(todecimal(price))
         limit = Limit(price)
         self.assertEqual(limit.price(), price)
 
@@ -109,9 +109,9 @@ class TestLimit(unittest.TestCase):
         order = self.mkorder(params)
         limit.enqueue(order)
 
-        limit.fill_next(5)
+        limit.fill_next(tofixed(todecimal(5)))
 
-        self.assertEqual(limit.next_order().quantity(), 5)
+        self.assertEqual(limit.next_order().quantity(), tofixed(todecimal(5)))
         self.assertEqual(limit.next_order().status(), OrderStatus.PARTIAL)
 
     @given(valid_price, valid_side, valid_qty, valid_otype_noGTD, valid_expiry_noGTD)
@@ -7,7 +7,7 @@ import time
 from fastlob import OrderParams
 from fastlob.consts import MAX_VALUE, MIN_VALUE
 from fastlob.enums import OrderSide, OrderType, OrderStatus
-from fastlob.utils import todecimal
+from fastlob.utils import todecimal, tofixed, fromstrid
 from fastlob.order import Order, BidOrder, AskOrder
 
 valid_side = st.sampled_from(OrderSide)
@@ -29,8 +29,8 @@ class TestOrder(unittest.TestCase):
         order = self.mkorder(params)
 
         self.assertEqual(order.side(), params.side)
-        self.assertEqual(order.price(), params.price)
-        self.assertEqual(order.quantity(), params.quantity)
+        self.assertEqual(order.price(), tofixed(params.price))
+        self.assertEqual(order.quantity(), tofixed(params.quantity))
         self.assertEqual(order.otype(), params.otype)
         self.assertEqual(order.expiry(), params.expiry)
         self.assertEqual(order.status(), OrderStatus.CREATED)
@@ -44,6 +44,18 @@ class TestOrder(unittest.TestCase):
 
         self.assertFalse(order1 == order2)
 
+    @given(valid_side, valid_price, valid_qty, valid_otype_noGTD, valid_expiry_noGTD)
+    def test_ids(self, side, price, qty, otype, expiry):
+        params = OrderParams(side, price, qty, otype, expiry) 
+
+        order1 = self.mkorder(params)
+        order2 = self.mkorder(params)
+
+        self.assertGreater(order2.id(), order1.id())
+        self.assertEqual(fromstrid(order1.strid()), order1.id())
+        self.assertEqual(len(order1.strid()), len(order2.strid()))
+        self.assertFalse(hasattr(order1, '__dict__'))
+
     @given(valid_side, valid_price, valid_qty, valid_otype_noGTD, valid_expiry_noGTD, valid_qty)
     def test_fill(self, side, price, qty, otype, expiry, tofill):
         params = OrderParams(side, price, qty, otype, expiry) 
@@ -53,7 +65,7 @@ class TestOrder(unittest.TestCase):
         self.assertEqual(order.quantity(), 0)
         self.assertEqual(order.status(), OrderStatus.FILLED)
 
-        tofill = todecimal(tofill)
+        tofill = tofixed(todecimal(tofill))
 
         order = self.mkorder(params)
         qty = order.quantity()
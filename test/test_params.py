@@ -28,7 +28,7 @@ class TestOrderParams(unittest.TestCase):
         self.assertEqual(params.quantity, todecimal(qty))
         self.assertEqual(params.otype, otype)
         if expiry is None: self.assertEqual(params.expiry, expiry)
-        else: self.assertEqual(params.expiry, int(expiry))
+        else: self.assertEqual(params.expiry, round(expiry, 3))
 
     @given(valid_side, valid_price, valid_qty, valid_otype, valid_expiry)
     def test_valid_init(self, side, price, qty, otype, expiry):
@@ -39,7 +39,7 @@ class TestOrderParams(unittest.TestCase):
         self.assertEqual(params.quantity, todecimal(qty))
         self.assertEqual(params.otype, otype)
         if expiry is None: self.assertEqual(params.expiry, expiry)
-        else: self.assertEqual(params.expiry, int(expiry))
+        else: self.assertEqual(params.expiry, round(expiry, 3))
 
     def test_invalid_side(self):
         with self.assertRaises(TypeError):
@@ -0,0 +1,89 @@
+import os, unittest, logging, tempfile, time
+
+from fastlob import Orderbook, OrderParams, OrderSide, OrderStatus
+from fastlob.registry import RetentionPolicy, OrderArchive
+from fastlob.utils import todecimal, tofixed
+
+class TestRegistry(unittest.TestCase):
+    def setUp(self): 
+        logging.basicConfig(level=logging.ERROR)
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def fill_orders(self, lob, n):
+        results = list()
+        for _ in range(n):
+            results.append(lob(OrderParams(OrderSide.BID, 100, 1)))
+            results.append(lob(OrderParams(OrderSide.ASK, 100, 1)))
+        return results
+
+    def test_no_policy(self):
+        lob = Orderbook('TestRegistry'); lob.start()
+        self.fill_orders(lob, 100)
+        self.assertEqual(len(lob._orders), 200)
+        lob.stop()
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError): RetentionPolicy(ttl=-1)
+        with self.assertRaises(ValueError): RetentionPolicy(capacity=-1)
+        with self.assertRaises(ValueError): RetentionPolicy(lru=True)
+        with self.assertRaises(ValueError): RetentionPolicy(ttl=1, capacity=1, lru=True)
+
+    def test_count(self):
+        lob = Orderbook('TestRegistry', retention=RetentionPolicy.by_count(10)); lob.start()
+        results = self.fill_orders(lob, 1000)
+        resting = lob(OrderParams(OrderSide.BID, 90, 1))
+        self.fill_orders(lob, 1000)
+
+        self.assertEqual(len(lob._orders), 11)
+        self.assertIsNone(lob.get_status(results[0].orderid()))
+        self.assertEqual(lob.get_status(resting.orderid())[0], OrderStatus.PENDING)
+        lob.stop()
+
+    def test_ttl(self):
+        lob = Orderbook('TestRegistry', retention=RetentionPolicy.by_ttl(0.05)); lob.start()
+        self.fill_orders(lob, 10)
+        self.assertEqual(len(lob._orders), 20)
+
+        time.sleep(0.1)
+        self.fill_orders(lob, 1)
+        self.assertLessEqual(len(lob._orders), 2)
+        lob.stop()
+
+    def test_lru(self):
+        lob = Orderbook('TestRegistry', retention=RetentionPolicy.by_lru(4)); lob.start()
+        results = self.fill_orders(lob, 2)
+        lob.get_status(results[0].orderid())
+        self.fill_orders(lob, 1)
+
+        self.assertIsNotNone(lob.get_status(results[0].orderid()))
+        self.assertIsNone(lob.get_status(results[1].orderid()))
+        lob.stop()
+
+    def test_cancel_retired(self):
+        lob = Orderbook('TestRegistry', retention=RetentionPolicy.by_count(0)); lob.start()
+        r = lob(OrderParams(OrderSide.BID, 100, 1))
+        lob.cancel(r.orderid())
+
+        self.assertEqual(len(lob._orders), 0)
+        self.assertFalse(lob.cancel(r.orderid()).success())
+        lob.stop()
+
+    def test_archive(self):
+        path = os.path.join(self.tmpdir.name, 'archive.bin')
+        lob = Orderbook('TestRegistry', retention=RetentionPolicy.by_count(0), archive=path); lob.start()
+        results = self.fill_orders(lob, 500)
+        r = lob(OrderParams(OrderSide.BID, 100, 3))
+        lob.cancel(r.orderid())
+
+        self.assertEqual(len(lob._orders), 0)
+        for result in results[::50]: self.assertEqual(lob.get_status(result.orderid()), (OrderStatus.FILLED, 0))
+        self.assertEqual(lob.get_status(r.orderid()), (OrderStatus.CANCELED, 3))
+        self.assertIsNone(lob.get_status(r.orderid() + 1))
+        lob.stop()
+
+        archive = OrderArchive(path)
+        self.assertEqual(archive.get(r.orderid()).price, tofixed(todecimal(100)))
+        archive.close()
@@ -6,6 +6,7 @@ from fastlob.enums import OrderStatus
 from fastlob.side import AskSide, BidSide
 from fastlob.order import AskOrder, BidOrder, OrderParams
 from fastlob.consts import MIN_VALUE, MAX_VALUE
+from fastlob.utils import todecimal, tofixed
 
 valid_side = st.sampled_from(OrderSide)
 valid_price = st.decimals(min_value=MIN_VALUE, max_value=MAX_VALUE-1000, allow_infinity=False, allow_nan=False)
@@ -76,7 +77,7 @@ class TestSide(unittest.TestCase):
         
         side.place(order)
 
-        self.assertEqual(side.best().price(), 100)
+        self.assertEqual(side.best().price(), tofixed(todecimal(100)))
         self.assertEqual(side.size(), 2)
 
     def test_ask_best_2(self):
@@ -92,7 +93,7 @@ class TestSide(unittest.TestCase):
         
         side.place(order)
 
-        self.assertEqual(side.best().price(), 100)
+        self.assertEqual(side.best().price(), tofixed(todecimal(100)))
         self.assertEqual(side.size(), 2)
 
     def test_bid_best(self):
@@ -108,7 +109,7 @@ class TestSide(unittest.TestCase):
         
         side.place(order)
 
-        self.assertEqual(side.best().price(), 200)
+        self.assertEqual(side.best().price(), tofixed(todecimal(200)))
         self.assertEqual(side.size(), 2)
 
     def test_bid_best_2(self):
@@ -124,7 +125,7 @@ class TestSide(unittest.TestCase):
         
         side.place(order)
 
-        self.assertEqual(side.best().price(), 200)
+        self.assertEqual(side.best().price(), tofixed(todecimal(200)))
         self.assertEqual(side.size(), 2)
 
     @given(valid_side, valid_price, valid_qty)